@@ -0,0 +1,45 @@
+"""Benchmarks for template project generation."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import pytest
+
+from bench import conftest
+from test.conftest import matrix
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from _pytest.fixtures import FixtureRequest
+    from pytest_cookies.plugin import Cookies
+
+
+@pytest.mark.parametrize(
+    ("template", "context"),
+    matrix,
+    ids=[conftest.name(template, context) for template, context in matrix],
+)
+def test_generate(
+    template: Path,
+    context: dict[str, Any],
+    calibration: dict[str, float],
+    cookies: Cookies,
+    request: FixtureRequest,
+) -> None:
+    """Project generation is not slower than its baseline."""
+    result, timings = conftest.measure(cookies, template, context, request.config)
+    files = [path for path in result.project_path.rglob("*") if path.is_file()]
+    benchmark = {
+        "bytes": sum(path.stat().st_size for path in files),
+        "files": len(files),
+        **{
+            metric: round(time / calibration[metric], 2)
+            for metric, time in timings.items()
+        },
+    }
+    print(f"\n{benchmark}")
+
+    errors = conftest.check(request.config, conftest.name(template, context), benchmark)
+    assert not errors, "\n".join(errors)
@@ -0,0 +1,199 @@
+"""Benchmark fixtures and baseline management.
+
+Timings are stored as ratios to a calibration bake of a minimal template in
+the same session, so that baselines carry over between machines of different
+speeds.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import statistics
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from cookiecutter import generate
+
+from test.conftest import matrix
+
+if TYPE_CHECKING:
+    from _pytest.config import Config
+    from _pytest.config.argparsing import Parser
+    from _pytest.fixtures import FixtureRequest
+    from _pytest.main import Session
+    from pytest_cookies.plugin import Cookies, Result
+
+BASELINE_PATH = Path(__file__).parent / "baseline.json"
+# Metrics that fail benchmarks when larger than their baseline.
+SIZES = ["bytes", "files"]
+# Metrics that fail benchmarks when slower than their baseline.
+TIMINGS = ["cpu", "hooks", "wall"]
+# Files of the minimal template for calibration bakes.
+CALIBRATION = {
+    "cookiecutter.json": '{"project_name": "calibration"}\n',
+    "hooks/post_gen_project.py": '"""Calibration hook."""\n',
+    "{{cookiecutter.project_name}}/README.md": "# {{ cookiecutter.project_name }}\n",
+}
+
+Benchmark = dict[str, Any]
+# Benchmark results of the current session.
+results: dict[str, Benchmark] = {}
+
+
+def pytest_addoption(parser: Parser) -> None:
+    """Add benchmark command line options."""
+    group = parser.getgroup("bench")
+    group.addoption(
+        "--bench-rounds",
+        default=5,
+        help="Number of repetitions for each benchmark",
+        type=int,
+    )
+    group.addoption(
+        "--bench-save",
+        action="store_true",
+        default=False,
+        help="Overwrite baselines with benchmark results",
+    )
+    group.addoption(
+        "--bench-threshold",
+        default=0.5,
+        help="Allowed fractional slowdown relative to baselines",
+        type=float,
+    )
+
+
+@pytest.fixture(scope="session")
+def calibration(
+    cookies_session: Cookies,
+    request: FixtureRequest,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> dict[str, float]:
+    """Timings of a minimal template bake on the current machine."""
+    template = tmp_path_factory.mktemp("calibration")
+    for path, text in CALIBRATION.items():
+        (template / path).parent.mkdir(exist_ok=True, parents=True)
+        (template / path).write_text(text)
+    _, timings = measure(cookies_session, template, {}, request.config)
+    return timings
+
+
+def pytest_sessionfinish(session: Session) -> None:
+    """Save benchmark results as baselines if requested.
+
+    Baselines of benchmarks that are no longer in the test matrix are removed.
+    """
+    if session.config.option.bench_save and results:
+        names = {name(template, context) for template, context in matrix}
+        baseline = {
+            key: value for key, value in load_baseline().items() if key in names
+        }
+        baseline.update(results)
+        text = json.dumps(dict(sorted(baseline.items())), indent=2)
+        BASELINE_PATH.write_text(f"{text}\n")
+
+
+def check(config: Config, name: str, result: Benchmark) -> list[str]:
+    """Compare benchmark result against its baseline.
+
+    Args:
+        config: Pytest configuration.
+        name: Benchmark identifier.
+        result: Benchmark metrics.
+
+    Returns:
+        Regression error messages.
+    """
+    results[name] = result
+    if config.option.bench_save:
+        return []
+    baseline = load_baseline().get(name)
+    if baseline is None:
+        message = (
+            f"Benchmark {name} has no baseline. Run benchmarks with --bench-save "
+            "to record it."
+        )
+        return [message]
+
+    threshold = config.option.bench_threshold
+    errors = []
+    for metric in SIZES:
+        limit = baseline[metric] * (1 + threshold)
+        if result[metric] > limit:
+            errors.append(
+                f"Benchmark {name} generated {result[metric]} {metric}, which "
+                f"exceeds baseline {baseline[metric]} by more than {threshold:.0%}."
+            )
+    for metric in TIMINGS:
+        limit = baseline[metric] * (1 + threshold)
+        if result[metric] > limit:
+            errors.append(
+                f"Benchmark {name} {metric} time of {result[metric]:.2f} "
+                f"calibration bakes exceeds baseline {baseline[metric]:.2f} by more "
+                f"than {threshold:.0%}."
+            )
+    return errors
+
+
+def cpu_time() -> float:
+    """Total CPU time of the current process and its finished children."""
+    times = os.times()
+    return times.user + times.system + times.children_user + times.children_system
+
+
+def measure(
+    cookies: Cookies, template: Path, context: dict[str, Any], config: Config
+) -> tuple[Result, dict[str, float]]:
+    """Bake template repeatedly and time each bake.
+
+    Args:
+        cookies: Cookiecutter helper for baking projects.
+        template: Cookiecutter template directory.
+        context: Template variables.
+        config: Pytest configuration.
+
+    Returns:
+        Last baked project and median seconds for each timing metric.
+    """
+    hooks: list[float] = []
+    run_hook = generate.run_hook_from_repo_dir
+
+    def run_hook_timed(*args: Any, **kwargs: Any) -> None:
+        start = time.perf_counter()
+        run_hook(*args, **kwargs)
+        hooks.append(time.perf_counter() - start)
+
+    cpus, walls, hook_totals = [], [], []
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setattr(generate, "run_hook_from_repo_dir", run_hook_timed)
+        for _ in range(config.option.bench_rounds):
+            hooks.clear()
+            start_cpu, start_wall = cpu_time(), time.perf_counter()
+            result = cookies.bake(extra_context=context, template=str(template))
+            walls.append(time.perf_counter() - start_wall)
+            cpus.append(cpu_time() - start_cpu)
+            hook_totals.append(sum(hooks))
+            assert result.exit_code == 0, str(result.exception)
+
+    timings = {
+        "cpu": statistics.median(cpus),
+        "hooks": statistics.median(hook_totals),
+        "wall": statistics.median(walls),
+    }
+    return result, timings
+
+
+def name(template: Path, context: dict[str, Any]) -> str:
+    """Benchmark identifier for a template and context pair."""
+    options = ",".join(f"{key}={value}" for key, value in sorted(context.items()))
+    return f"{template.name}[{options}]"
+
+
+def load_baseline() -> dict[str, Benchmark]:
+    """Read stored benchmark baselines."""
+    if BASELINE_PATH.exists():
+        return json.loads(BASELINE_PATH.read_text())
+    return {}
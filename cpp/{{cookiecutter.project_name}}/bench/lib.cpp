@@ -0,0 +1,30 @@
+// Library benchmarks.
+
+#include <benchmark/benchmark.h>
+
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+#include "lib.hpp"
+
+namespace {
+// Number of input bytes per benchmark iteration.
+constexpr std::size_t size = 1U << 20U;
+
+void bench_checksum(benchmark::State& state) {
+    std::string data(size, '\0');
+    for (std::size_t index = 0; index < size; ++index) {
+        data[index] = static_cast<char>(static_cast<unsigned char>(index));
+    }
+    for (auto _ : state) {
+        benchmark::DoNotOptimize(checksum(data));
+    }
+    state.SetBytesProcessed(state.iterations() *
+                            static_cast<std::int64_t>(size));
+}
+}  // namespace
+
+// Registration macros define mutable globals with dynamic initialization.
+// NOLINTNEXTLINE(cert-err58-cpp,cppcoreguidelines-avoid-non-const-global-variables)
+BENCHMARK(bench_checksum)->Name("checksum/1MiB");
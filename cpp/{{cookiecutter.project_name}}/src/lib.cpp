@@ -1,8 +1,33 @@
 // Template for C++ projects.
 
-#ifdef TEST
-#include <catch2/catch_test_macros.hpp>
+#include "lib.hpp"
 
-TEST_CASE("dummy_test") { REQUIRE(true == true); }
+#include <cstddef>
+#include <cstdint>
+#include <string_view>
 
-#endif
+namespace {
+// Largest prime below 2^16, which is the modulus of Adler-32 sums.
+constexpr std::uint32_t modulus = 65'521;
+// Maximum number of bytes that can be summed before the sums overflow.
+constexpr std::size_t block = 5'552;
+// Bit offset of the high sum in the checksum.
+constexpr std::uint32_t shift = 16;
+}  // namespace
+
+std::uint32_t checksum(std::string_view data) {
+    std::uint32_t low = 1;
+    std::uint32_t high = 0;
+    // Reduce sums once per block instead of once per byte.
+    while (!data.empty()) {
+        const std::string_view chunk = data.substr(0, block);
+        for (const char byte : chunk) {
+            low += static_cast<unsigned char>(byte);
+            high += low;
+        }
+        low %= modulus;
+        high %= modulus;
+        data.remove_prefix(chunk.size());
+    }
+    return (high << shift) | low;
+}
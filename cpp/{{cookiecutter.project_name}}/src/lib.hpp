@@ -1 +1,14 @@
 // Template for C++ projects.
+
+#ifndef {{ cookiecutter.__project_package | upper }}_LIB_HPP
+#define {{ cookiecutter.__project_package | upper }}_LIB_HPP
+
+#include <cstdint>
+#include <string_view>
+
+// Compute Adler-32 checksum of data.
+//
+// Replace with performance critical library code.
+std::uint32_t checksum(std::string_view data);
+
+#endif  // {{ cookiecutter.__project_package | upper }}_LIB_HPP
@@ -0,0 +1,31 @@
+// Library tests.
+
+#include <catch2/catch_test_macros.hpp>
+#include <cstddef>
+#include <cstdint>
+#include <string>
+
+#include "lib.hpp"
+
+TEST_CASE("checksum_known") {
+    // Known Adler-32 checksums of short strings.
+    constexpr std::uint32_t letter = 0x0062'0062;
+    constexpr std::uint32_t word = 0x11E6'0398;
+    REQUIRE(checksum("") == 1);
+    REQUIRE(checksum("a") == letter);
+    REQUIRE(checksum("Wikipedia") == word);
+}
+
+TEST_CASE("checksum_overflow") {
+    constexpr std::size_t length = 100'000;
+    constexpr std::uint64_t modulus = 65'521;
+    constexpr std::uint64_t shift = 16;
+    const std::string data(length, '\xFF');
+    std::uint64_t low = 1;
+    std::uint64_t high = 0;
+    for (const char byte : data) {
+        low = (low + static_cast<unsigned char>(byte)) % modulus;
+        high = (high + low) % modulus;
+    }
+    REQUIRE(checksum(data) == ((high << shift) | low));
+}
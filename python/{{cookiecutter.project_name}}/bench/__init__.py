@@ -0,0 +1,14 @@
+"""{{ cookiecutter.project_name }} benchmarking package."""
+
+from pytest_benchmark.fixture import BenchmarkFixture
+
+import {{ cookiecutter.__project_package }}
+
+
+def test_version(benchmark: BenchmarkFixture) -> None:
+    """Benchmark package version lookup.
+
+    Replace with benchmarks of performance critical code.
+    """
+    actual = benchmark(getattr, {{ cookiecutter.__project_package }}, "__version__")
+    assert actual == {{ cookiecutter.__project_package }}.__version__
@@ -1,13 +1,85 @@
 """{{ cookiecutter.project_name }} testing package."""
 
+import os
+import re
+import subprocess
+import sys
 import tomllib
 from pathlib import Path
 
+import pytest
+
 import {{ cookiecutter.__project_package }}
 
+# Maximum ratio of startup import times with and without cached bytecode.
+BYTECODE_SPEEDUP = 0.8
+# Maximum import time in microseconds for starting {{ cookiecutter.project_name }}.
+IMPORT_BUDGET = 50_000
 REPO_PATH = Path(__file__).parents[1]
+{%- if cookiecutter.project_cli %}
+STARTUP = ["-m", "{{ cookiecutter.__project_package }}", "--version"]
+{%- else %}
+STARTUP = ["-c", "import {{ cookiecutter.__project_package }}"]
+{%- endif %}
+
+
+def import_time(*args: str, cache: Path | None = None) -> dict[str, int]:
+    """Measure top level import times of a Python command.
+
+    Args:
+        args: Python interpreter arguments.
+        cache: Directory for bytecode files instead of __pycache__ folders.
+
+    Returns:
+        Cumulative import time in microseconds for each top level module.
+    """
+    env = dict(os.environ)
+    if cache is not None:
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = str(cache)
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        check=True,
+        env=env,
+        text=True,
+    )
+    regex = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| (\S+)$")
+    return {
+        match.group(2): int(match.group(1))
+        for match in map(regex.match, process.stderr.splitlines())
+        if match
+    }
+
+
+@pytest.mark.e2e
+def test_import_time() -> None:
+    """Check that startup imports stay within the import time budget."""
+    baseline = import_time("-c", "pass")
+    imports = import_time(*STARTUP)
+    modules = {name: time for name, time in imports.items() if name not in baseline}
+    assert sum(modules.values()) < IMPORT_BUDGET, modules
+
+
+@pytest.mark.e2e
+def test_startup_bytecode(tmp_path: Path) -> None:
+    """Check that precompiled bytecode makes startup imports faster."""
+    # A first run writes bytecode for all startup imports, like an install that
+    # compiles its packages. Option -B keeps the cold cache empty afterwards,
+    # and the fastest of several runs reduces noise from other processes.
+    warm_cache = tmp_path / "warm"
+    import_time(*STARTUP, cache=warm_cache)
+    cold = min(
+        sum(import_time("-B", *STARTUP, cache=tmp_path / "cold").values())
+        for _ in range(3)
+    )
+    warm = min(
+        sum(import_time("-B", *STARTUP, cache=warm_cache).values()) for _ in range(3)
+    )
+    assert warm < BYTECODE_SPEEDUP * cold, f"cold {cold} us, warm {warm} us"
 
 
+@pytest.mark.unit
 def test_version() -> None:
     """Check that all the version tags are in sync."""
     path = REPO_PATH / "pyproject.toml"
@@ -0,0 +1,49 @@
+//! Library benchmarks.
+
+{% if cookiecutter.project_parallel -%}
+use criterion::{BenchmarkId, Criterion, Throughput, criterion_group, criterion_main};
+{%- else -%}
+use criterion::{Criterion, Throughput, criterion_group, criterion_main};
+{%- endif %}
+use std::hint::black_box;
+
+use {{ cookiecutter.__project_package }}::checksum;
+{%- if cookiecutter.project_parallel %}
+use {{ cookiecutter.__project_package }}::process::map_lines;
+{%- endif %}
+
+/// Number of input bytes per benchmark iteration.
+const SIZE: usize = 1 << 20;
+
+fn bench_checksum(criterion: &mut Criterion) {
+    let data: Vec<u8> = (0..=u8::MAX).cycle().take(SIZE).collect();
+    let mut group = criterion.benchmark_group("checksum");
+    group.throughput(Throughput::Bytes(SIZE as u64));
+    group.bench_function("1MiB", |bencher| {
+        bencher.iter(|| checksum(black_box(&data)));
+    });
+    group.finish();
+}
+
+{% if cookiecutter.project_parallel -%}
+fn bench_map_lines(criterion: &mut Criterion) {
+    let data = b"Replace me with benchmark data.\n".repeat(SIZE << 1);
+    let mut group = criterion.benchmark_group("map_lines");
+    group.throughput(Throughput::Bytes(data.len() as u64));
+    for chunk_size in [1 << 12, 1 << 16, 1 << 20] {
+        group.bench_with_input(
+            BenchmarkId::from_parameter(chunk_size),
+            &chunk_size,
+            |bencher, &chunk_size| {
+                bencher.iter(|| map_lines(black_box(&data), chunk_size, checksum));
+            },
+        );
+    }
+    group.finish();
+}
+
+criterion_group!(benches, bench_checksum, bench_map_lines);
+{%- else -%}
+criterion_group!(benches, bench_checksum);
+{%- endif %}
+criterion_main!(benches);
@@ -1 +1,35 @@
 //! {{ cookiecutter.project_description }}
+
+{% if cookiecutter.project_parallel -%}
+pub mod process;
+
+{% endif -%}
+/// Largest prime below 2^16, which is the modulus of Adler-32 sums.
+const MODULUS: u32 = 65_521;
+/// Maximum number of bytes that can be summed before the sums overflow.
+const BLOCK: usize = 5_552;
+
+/// Compute Adler-32 checksum of data.
+///
+/// Replace with performance critical library code.
+///
+/// # Examples
+///
+/// ```
+/// assert_eq!({{ cookiecutter.__project_package }}::checksum(b"Wikipedia"), 0x11E6_0398);
+/// ```
+#[must_use]
+pub fn checksum(data: &[u8]) -> u32 {
+    let mut low: u32 = 1;
+    let mut high: u32 = 0;
+    // Reduce sums once per block instead of once per byte.
+    for block in data.chunks(BLOCK) {
+        for &byte in block {
+            low += u32::from(byte);
+            high += low;
+        }
+        low %= MODULUS;
+        high %= MODULUS;
+    }
+    (high << 16) | low
+}
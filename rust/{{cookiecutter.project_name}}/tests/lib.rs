@@ -0,0 +1,22 @@
+//! Library tests.
+
+use test_case::test_case;
+
+use {{ cookiecutter.__project_package }}::checksum;
+
+#[test_case(b"" => 1; "empty")]
+#[test_case(b"a" => 0x0062_0062; "single byte")]
+#[test_case(b"Wikipedia" => 0x11E6_0398; "word")]
+fn checksum_known(data: &[u8]) -> u32 {
+    checksum(data)
+}
+
+#[test]
+fn checksum_overflow() {
+    let data = vec![u8::MAX; 100_000];
+    let (low, high) = data.iter().fold((1u64, 0u64), |(low, high), &byte| {
+        let low = (low + u64::from(byte)) % 65_521;
+        (low, (high + low) % 65_521)
+    });
+    assert_eq!(u64::from(checksum(&data)), (high << 16) | low);
+}
@@ -0,0 +1 @@
+"""Repository maintenance scripts."""
@@ -0,0 +1,266 @@
+"""Generate many projects from a template in a single process.
+
+Cookiecutter reparses the template configuration and recompiles every template
+file for each invocation. This script loads the template configuration once and
+shares a Jinja bytecode cache between all generated projects.
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TextIO
+
+from cookiecutter.generate import (
+    apply_overwrites_to_context,
+    generate_context,
+    generate_files,
+)
+from cookiecutter.prompt import prompt_for_config
+from jinja2 import BytecodeCache, FileSystemBytecodeCache
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    from jinja2.bccache import Bucket
+
+
+FORMATS = ["csv", "json", "jsonl"]
+REPO_PATH = Path(__file__).parents[1]
+TEMPLATES = ["cpp", "python", "rust", "vue"]
+
+# Per process generator state initialized by `setup`.
+state: dict[str, Any] = {}
+
+
+class MemoryBytecodeCache(BytecodeCache):
+    """Jinja bytecode cache stored in process memory."""
+
+    def __init__(self) -> None:
+        """Create empty cache."""
+        self.codes: dict[str, bytes] = {}
+
+    def dump_bytecode(self, bucket: Bucket) -> None:
+        """Store compiled template bytecode.
+
+        Args:
+            bucket: Jinja cache bucket for a template.
+        """
+        self.codes[bucket.key] = bucket.bytecode_to_string()
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load compiled template bytecode if available.
+
+        Args:
+            bucket: Jinja cache bucket for a template.
+        """
+        code = self.codes.get(bucket.key)
+        if code is not None:
+            bucket.bytecode_from_string(code)
+
+
+def bake(extra_context: dict[str, Any]) -> str:
+    """Generate project with the template loaded by `setup`.
+
+    Args:
+        extra_context: Template variables to override.
+
+    Returns:
+        Generated project path.
+    """
+    template = state["template"]
+    context = copy.deepcopy(state["context"])
+    apply_overwrites_to_context(context["cookiecutter"], extra_context)
+    context["_cookiecutter"] = {
+        key: value
+        for key, value in context["cookiecutter"].items()
+        if not key.startswith("_")
+    }
+    context["cookiecutter"].update(prompt_for_config(context, no_input=True))
+    context["cookiecutter"].update(
+        {
+            "_checkout": None,
+            "_jinja2_env_vars": {
+                **context["cookiecutter"].get("_jinja2_env_vars", {}),
+                "bytecode_cache": state["cache"],
+            },
+            "_output_dir": str(state["output"]),
+            "_repo_dir": str(template),
+            "_template": str(template),
+        }
+    )
+    return generate_files(
+        context=context, output_dir=state["output"], repo_dir=template
+    )
+
+
+def bake_all(
+    template: Path,
+    contexts: Iterator[dict[str, Any]],
+    output: Path,
+    cache_dir: Path | None = None,
+    workers: int = 1,
+) -> Iterator[str | BaseException]:
+    """Generate a project for each context.
+
+    Args:
+        template: Cookiecutter template directory.
+        contexts: Template variables to override for each project.
+        output: Parent directory for generated projects.
+        cache_dir: Directory for persisting Jinja bytecode between runs.
+        workers: Number of processes for generating projects.
+
+    Yields:
+        Generated project path or generation error in context order.
+    """
+    if workers < 2:
+        setup(template, output, cache_dir)
+        for context in contexts:
+            yield _try_bake(context)
+        return
+
+    with ProcessPoolExecutor(
+        initargs=(template, output, cache_dir),
+        initializer=setup,
+        max_workers=workers,
+    ) as executor:
+        yield from executor.map(_try_bake, contexts, chunksize=16)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Entrypoint for batch project generation.
+
+    Args:
+        argv: Command line arguments.
+
+    Returns:
+        Process exit code.
+    """
+    parser = argparse.ArgumentParser(
+        description="Generate projects from a template for each context."
+    )
+    parser.add_argument(
+        "template",
+        help=f"Template name ({', '.join(TEMPLATES)}) or template directory",
+    )
+    parser.add_argument(
+        "contexts",
+        default="-",
+        help="Context file or '-' for standard input",
+        nargs="?",
+    )
+    parser.add_argument(
+        "-c", "--cache-dir", help="Directory for persisting Jinja bytecode"
+    )
+    parser.add_argument(
+        "-f",
+        "--format",
+        choices=FORMATS,
+        help="Context file format (default: file extension or jsonl)",
+    )
+    parser.add_argument(
+        "-o", "--output", default=".", help="Parent directory for projects"
+    )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        default=1,
+        help="Number of processes (0 for number of CPUs)",
+        type=int,
+    )
+    args = parser.parse_args(argv)
+
+    template = (
+        REPO_PATH / args.template
+        if args.template in TEMPLATES
+        else Path(args.template).resolve()
+    )
+    suffix = Path(args.contexts).suffix.removeprefix(".")
+    format_ = args.format or (suffix if suffix in FORMATS else "jsonl")
+    cache_dir = None if args.cache_dir is None else Path(args.cache_dir)
+    workers = args.workers or os.cpu_count() or 1
+
+    errors = 0
+    with (
+        sys.stdin
+        if args.contexts == "-"
+        else Path(args.contexts).open(encoding="utf-8", newline="")
+    ) as file:
+        contexts = read_contexts(file, format_)
+        for result in bake_all(
+            template, contexts, Path(args.output), cache_dir, workers
+        ):
+            if isinstance(result, BaseException):
+                errors += 1
+                print(f"error: {result}", file=sys.stderr)
+            else:
+                print(result)
+    return 1 if errors else 0
+
+
+def read_contexts(file: TextIO, format_: str) -> Iterator[dict[str, Any]]:
+    """Parse template contexts from a text stream.
+
+    Args:
+        file: Text stream of contexts.
+        format_: Stream format, one of csv, json, or jsonl.
+
+    Yields:
+        Template variables for each project.
+    """
+    if format_ == "csv":
+        yield from csv.DictReader(file)
+    elif format_ == "json":
+        yield from json.load(file)
+    elif format_ == "jsonl":
+        for line in file:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        message = f"Unsupported context format '{format_}'."
+        raise ValueError(message)
+
+
+def setup(template: Path, output: Path, cache_dir: Path | None = None) -> None:
+    """Load template configuration and bytecode cache for the current process.
+
+    Args:
+        template: Cookiecutter template directory.
+        output: Parent directory for generated projects.
+        cache_dir: Directory for persisting Jinja bytecode between runs.
+    """
+    if cache_dir is None:
+        cache: BytecodeCache = MemoryBytecodeCache()
+    else:
+        cache_dir.mkdir(exist_ok=True, parents=True)
+        cache = FileSystemBytecodeCache(str(cache_dir))
+
+    output.mkdir(exist_ok=True, parents=True)
+    state.update(
+        cache=cache,
+        context=generate_context(context_file=template / "cookiecutter.json"),
+        output=output.resolve(),
+        template=template,
+    )
+
+
+def _try_bake(extra_context: dict[str, Any]) -> str | BaseException:
+    """Generate project and return errors instead of raising them.
+
+    Errors are converted to runtime errors, since Cookiecutter exceptions can
+    hold unpicklable data and must be sent between processes.
+    """
+    try:
+        return bake(extra_context)
+    except Exception as exception:  # noqa: BLE001
+        return RuntimeError(f"{type(exception).__name__}: {exception}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -12,8 +12,12 @@ import pytest
 from test import util
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pytest_cookies.plugin import Cookies, Result
 
+    Rule = Callable[[Path, str], str | None]
+
 
 templates = ["python", "rust", "vue"]
 
@@ -57,43 +61,61 @@ def test_existing_paths(
         assert file_path.exists()
 
 
-def test_no_blank_lines(project: Result) -> None:
+def no_blank_lines(path: Path, text: str) -> str | None:
     """Project files do not have whitespace only lines."""
     regex = re.compile(r"^\s+$")
-    error_msg = "File {}, line {}: {} has whitespace."
-
-    for path in util.file_matches(project, r"^.*$"):
-        for idx, line in enumerate(path.read_text().split("\n")):
-            match = regex.match(line)
-            assert match is None, error_msg.format(path, idx, line)
+    for idx, line in enumerate(text.split("\n")):
+        if regex.match(line):
+            return f"File {path}, line {idx}: {line} has whitespace."
+    return None
 
 
-def test_no_contiguous_blank_lines(project: Result) -> None:
+def no_contiguous_blank_lines(path: Path, text: str) -> str | None:
     """Project files do not have subsequent empty lines."""
     regex = re.compile(r"\n\s*\n\s*\n")
-    for path in util.file_matches(project, r"^.*(?<!.py)$"):
-        text = path.read_text()
+    if regex.search(text):
+        return f"File {path} has contiguous blank lines."
+    return None
 
-        match = regex.search(text)
-        assert match is None, f"File {path} has contiguous blank lines."
 
-
-def test_no_starting_blank_line(project: Result) -> None:
+def no_starting_blank_line(path: Path, text: str) -> str | None:
     """Check that generated files do not start with a blank line."""
     regex = re.compile(r"^\s*$")
-    for path in util.file_matches(project, r"^.*(?<!\.typed)$"):
-        text = path.read_text().split("\n")[0]
-        assert not regex.match(text), f"File {path} begins with a blank line."
+    if regex.match(text.split("\n", maxsplit=1)[0]):
+        return f"File {path} begins with a blank line."
+    return None
 
 
-def test_no_trailing_blank_line(project: Result) -> None:
+def no_trailing_blank_line(path: Path, text: str) -> str | None:
     """Check that generated files do not have a trailing blank line."""
     regex = re.compile(r"\n\s*$")
-    for path in util.file_matches(project, r"^.*$"):
-        text = path.read_text()
-
-        match = regex.match(text)
-        assert match is None, f"File {path} ends with a blank line."
+    if regex.match(text):
+        return f"File {path} ends with a blank line."
+    return None
+
+
+# File name regexes and the content rules that apply to matching files.
+rules: list[tuple[re.Pattern[str], Rule]] = [
+    (re.compile(r"^.*$"), no_blank_lines),
+    (re.compile(r"^.*(?<!.py)$"), no_contiguous_blank_lines),
+    (re.compile(r"^.*(?<!\.typed)$"), no_starting_blank_line),
+    (re.compile(r"^.*$"), no_trailing_blank_line),
+]
+
+
+def test_file_rules(project: Result) -> None:
+    """Project files satisfy all whitespace rules.
+
+    Files are read once and every applicable rule checks the same contents.
+    """
+    errors = []
+    for path, text in util.file_index(project).items():
+        for regex, rule in rules:
+            if regex.match(path.name):
+                error = rule(path, text)
+                if error is not None:
+                    errors.append(error)
+    assert not errors, "\n".join(errors)
 
 
 @pytest.mark.parametrize(
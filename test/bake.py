@@ -0,0 +1,255 @@
+"""Content addressed project generation cache for testing."""
+
+from __future__ import annotations
+
+import contextlib
+import functools
+import hashlib
+import json
+import multiprocessing
+import os
+import re
+import shutil
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+import cookiecutter
+from cookiecutter.generate import generate_context
+from cookiecutter.main import cookiecutter as generate
+from cookiecutter.prompt import prompt_for_config
+from pytest_cookies.plugin import Result
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+
+# Directory names of baked projects, which are truncated hexadecimal digests.
+KEY_REGEX = re.compile(r"[0-9a-f]{32}")
+# Session cache of baked projects keyed by content hash.
+results: dict[str, Result] = {}
+
+
+def bake(
+    template: Path, context: Mapping[str, Any], cache_dir: Path, config_file: Path
+) -> Result:
+    """Generate a project or reuse an identical previous generation.
+
+    Projects are stored under the cache directory by content hash, so callers
+    must treat the returned project as read only. Use `clone` to get a
+    writable copy.
+
+    Args:
+        template: Cookiecutter template directory.
+        context: Extra context passed to Cookiecutter.
+        cache_dir: Directory for storing baked projects across sessions.
+        config_file: Cookiecutter user configuration file.
+
+    Returns:
+        Project generation result.
+    """
+    key = cache_key(template, context)
+    if key in results:
+        return results[key]
+
+    dest = cache_dir / key
+    with lock(dest):
+        if (dest / "result.json").exists():
+            metadata = json.loads((dest / "result.json").read_text())
+            result = Result(
+                context=metadata["context"],
+                project_dir=str(dest / metadata["project"]),
+            )
+        else:
+            result = _generate(template, context, dest, config_file)
+
+    if result.exit_code == 0:
+        results[key] = result
+    return result
+
+
+def bake_all(
+    pairs: Sequence[tuple[Path, Mapping[str, Any]]],
+    cache_dir: Path,
+    config_file: Path,
+    workers: int | None = None,
+) -> None:
+    """Generate projects for all template and context pairs in parallel.
+
+    Projects are stored in the cache directory for later `bake` calls. Errors
+    are ignored, since `bake` reproduces them in the calling process.
+
+    Args:
+        pairs: Cookiecutter template directories and extra contexts.
+        cache_dir: Directory for storing baked projects across sessions.
+        config_file: Cookiecutter user configuration file.
+        workers: Maximum number of processes. Defaults to the number of CPUs.
+    """
+    pairs = [
+        (template, context)
+        for template, context in pairs
+        if cache_key(template, context) not in results
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(pairs))
+    if workers < 2:
+        for template, context in pairs:
+            bake(template, context, cache_dir, config_file)
+        return
+
+    # Spawn avoids forking the threads of the parent pytest process.
+    context_ = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context_) as executor:
+        futures = [
+            executor.submit(_prebake, template, dict(context), cache_dir, config_file)
+            for template, context in pairs
+        ]
+        for future in futures:
+            future.result()
+
+
+def cache_key(template: Path, context: Mapping[str, Any]) -> str:
+    """Compute unique hash for a template and context pair.
+
+    Args:
+        template: Cookiecutter template directory.
+        context: Extra context passed to Cookiecutter.
+
+    Returns:
+        Hexadecimal digest.
+    """
+    hasher = hashlib.sha256()
+    hasher.update(cookiecutter.__version__.encode())
+    hasher.update(template_hash(template).encode())
+    hasher.update(json.dumps(context, sort_keys=True).encode())
+    return hasher.hexdigest()[:32]
+
+
+def clone(project: Result, dest: Path) -> Result:
+    """Copy baked project to a writable location.
+
+    Args:
+        project: Baked project to copy.
+        dest: Parent directory for the copy.
+
+    Returns:
+        Project generation result for the copy, or the project unchanged if its
+        generation failed.
+    """
+    if project.exit_code != 0 or project.exception is not None:
+        return project
+    project_dir = dest / project.project_path.name
+    shutil.copytree(project.project_path, project_dir, symlinks=True)
+    return Result(context=project.context, project_dir=str(project_dir))
+
+
+@contextlib.contextmanager
+def lock(path: Path, timeout: float = 600) -> Iterator[None]:
+    """Context manager for exclusive access to a path across processes.
+
+    Args:
+        path: File system path to guard.
+        timeout: Seconds after which an existing lock is considered stale.
+    """
+    lock_path = path.with_name(f"{path.name}.lock")
+    lock_path.parent.mkdir(exist_ok=True, parents=True)
+    while True:
+        try:
+            descriptor = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+            break
+        except FileExistsError:
+            with contextlib.suppress(FileNotFoundError):
+                if time.time() - lock_path.stat().st_mtime > timeout:
+                    lock_path.unlink()
+            time.sleep(0.05)
+
+    try:
+        yield
+    finally:
+        os.close(descriptor)
+        lock_path.unlink(missing_ok=True)
+
+
+def prune(cache_dir: Path, keys: Iterable[str]) -> None:
+    """Remove cached projects whose keys are no longer current.
+
+    Every template edit changes the keys of its projects, so without pruning
+    each edit leaves another full project tree in the cache.
+
+    Args:
+        cache_dir: Directory for storing baked projects across sessions.
+        keys: Cache keys of projects to keep.
+    """
+    if not cache_dir.exists():
+        return
+    keep = set(keys)
+    for path in cache_dir.iterdir():
+        if path.is_dir() and KEY_REGEX.fullmatch(path.name) and path.name not in keep:
+            with lock(path):
+                shutil.rmtree(path, ignore_errors=True)
+
+
+@functools.cache
+def template_hash(template: Path) -> str:
+    """Compute hash of all file paths and contents in a template.
+
+    Args:
+        template: Cookiecutter template directory.
+
+    Returns:
+        Hexadecimal digest.
+    """
+    hasher = hashlib.sha256()
+    for path in sorted(template.rglob("*")):
+        if path.is_file() and "__pycache__" not in path.parts:
+            hasher.update(path.relative_to(template).as_posix().encode())
+            hasher.update(path.read_bytes())
+    return hasher.hexdigest()
+
+
+def _generate(
+    template: Path, context: Mapping[str, Any], dest: Path, config_file: Path
+) -> Result:
+    """Bake project and atomically move it into the cache."""
+    dest.parent.mkdir(exist_ok=True, parents=True)
+    temp = Path(tempfile.mkdtemp(dir=dest.parent, prefix=".bake-"))
+    try:
+        rendered = prompt_for_config(
+            generate_context(
+                context_file=str(template / "cookiecutter.json"),
+                extra_context=dict(context),
+            ),
+            no_input=True,
+        )
+        project_dir = Path(
+            generate(
+                str(template),
+                config_file=str(config_file),
+                extra_context=dict(context),
+                no_input=True,
+                output_dir=str(temp),
+            )
+        )
+    except SystemExit as exception:
+        shutil.rmtree(temp, ignore_errors=True)
+        return Result(exception=exception, exit_code=exception.code)
+    except Exception as exception:  # noqa: BLE001
+        shutil.rmtree(temp, ignore_errors=True)
+        return Result(exception=exception, exit_code=-1)
+
+    metadata = {"context": rendered, "project": project_dir.name}
+    (temp / "result.json").write_text(json.dumps(metadata))
+    try:
+        temp.rename(dest)
+    except OSError:
+        # Another process finished baking the same project first.
+        shutil.rmtree(temp, ignore_errors=True)
+    return Result(context=rendered, project_dir=str(dest / project_dir.name))
+
+
+def _prebake(
+    template: Path, context: dict[str, Any], cache_dir: Path, config_file: Path
+) -> None:
+    """Bake project into cache inside a worker process."""
+    bake(template, context, cache_dir, config_file)
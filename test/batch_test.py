@@ -0,0 +1,53 @@
+"""Batch project generation tests."""
+
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from script import batch
+
+TEMPLATE = Path(__file__).parents[1] / "python"
+
+
+@pytest.mark.parametrize(
+    ("format_", "text"),
+    [
+        ("csv", "project_name,project_cli\nmock-a,true\nmock-b,false\n"),
+        (
+            "json",
+            (
+                '[{"project_name": "mock-a"}, '
+                '{"project_name": "mock-b", "project_cli": false}]'
+            ),
+        ),
+        (
+            "jsonl",
+            (
+                '{"project_name": "mock-a"}\n'
+                '{"project_name": "mock-b", "project_cli": false}\n'
+            ),
+        ),
+    ],
+)
+def test_bake_all(format_: str, text: str, tmp_path: Path) -> None:
+    """Generate projects for each context in a stream."""
+    contexts = batch.read_contexts(io.StringIO(text), format_)
+    results = list(batch.bake_all(TEMPLATE, contexts, tmp_path))
+    assert results == [str(tmp_path / "mock-a"), str(tmp_path / "mock-b")]
+    assert (tmp_path / "mock-a/src/mock_a/__main__.py").exists()
+    assert not (tmp_path / "mock-b/src/mock_b/__main__.py").exists()
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_bake_all_errors(workers: int, tmp_path: Path) -> None:
+    """Generation errors are returned without stopping other projects."""
+    contexts = iter(
+        [{"project_name": "mock"}, {"project_name": "mock"}, {"project_name": "mock-c"}]
+    )
+    results = list(batch.bake_all(TEMPLATE, contexts, tmp_path, workers=workers))
+    assert results[0] == str(tmp_path / "mock")
+    assert isinstance(results[1], RuntimeError)
+    assert results[2] == str(tmp_path / "mock-c")
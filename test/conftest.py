@@ -1,30 +1,44 @@
 """Reusable testing fixtures."""
 
+import re
+from collections.abc import Callable
 from pathlib import Path
+from typing import Any
 
 import pytest
 from _pytest.fixtures import FixtureRequest
-from pytest_cookies.plugin import Cookies, Result
+from pytest_cookies.plugin import Result
+
+from test import bake, seed
 
 contexts_cpp = [
     {
         "project_cli": True,
         "project_repository": "https://github.com/scruffaluff/templates",
     },
+    {
+        "project_cli": False,
+        "project_repository": "https://gitlab.com/scruffaluff/templates",
+    },
 ]
 contexts_python = [
     {
+        "project_async": True,
         "project_cli": True,
+        "project_instrument": True,
         "project_repository": "https://github.com/scruffaluff/templates",
     },
     {
         "project_cli": False,
+        "project_compiled": True,
+        "project_parallel": True,
         "project_repository": "https://gitlab.org/scruffaluff/templates",
     },
 ]
 contexts_rust = [
     {
         "project_cli": True,
+        "project_parallel": True,
         "project_repository": "https://github.com/scruffaluff/templates",
     },
     {
@@ -37,55 +51,118 @@ contexts_vue = [
     {"project_repository": "https://gitlab.com/scruffaluff/templates"},
 ]
 repo_path = Path(__file__).parents[1]
+matrix = [
+    *((repo_path / "cpp", context) for context in contexts_cpp),
+    *((repo_path / "python", context) for context in contexts_python),
+    *((repo_path / "rust", context) for context in contexts_rust),
+    *((repo_path / "vue", context) for context in contexts_vue),
+]
+
+Bakery = Callable[[Path, dict[str, Any]], Result]
+BuildCache = Callable[[Result], Path]
+Seeder = Callable[[Result], None]
+
+
+def cache_dir(
+    request: FixtureRequest, tmp_path_factory: pytest.TempPathFactory, name: str
+) -> Path:
+    """Directory for caching data across test sessions if possible."""
+    if getattr(request.config, "cache", None) is None:
+        return tmp_path_factory.mktemp(name)
+    return request.config.cache.mkdir(name)
+
+
+@pytest.fixture(scope="session")
+def bake_dir(request: FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Directory for caching baked projects across test sessions."""
+    return cache_dir(request, tmp_path_factory, "bake")
+
+
+@pytest.fixture(scope="session")
+def bakery(bake_dir: Path, _cookiecutter_config_file: Path) -> Bakery:
+    """Cached project generator shared across the test session.
+
+    All projects in the context matrix are baked in parallel on first use, and
+    projects from earlier template versions are removed from the cache.
+    """
+    bake.prune(bake_dir, (bake.cache_key(*pair) for pair in matrix))
+    bake.bake_all(matrix, bake_dir, _cookiecutter_config_file)
+
+    def bake_(template: Path, context: dict[str, Any]) -> Result:
+        return bake.bake(template, context, bake_dir, _cookiecutter_config_file)
+
+    return bake_
+
+
+@pytest.fixture(scope="session")
+def build_cache(
+    request: FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> BuildCache:
+    """Shared compiler output folders for projects that run build recipes."""
+    build_dir = cache_dir(request, tmp_path_factory, "build")
+
+    def build_cache_(project: Result) -> Path:
+        return seed.build_cache(project, build_dir)
+
+    return build_cache_
 
 
 @pytest.fixture(
-    params=[
-        *(
-            {"context": context, "template": repo_path / "cpp"}
-            for context in contexts_cpp
-        ),
-        *(
-            {"context": context, "template": repo_path / "python"}
-            for context in contexts_python
-        ),
-        *(
-            {"context": context, "template": repo_path / "rust"}
-            for context in contexts_rust
-        ),
-        *(
-            {"context": context, "template": repo_path / "vue"}
-            for context in contexts_vue
-        ),
-    ],
+    params=[{"context": context, "template": template} for template, context in matrix]
 )
-def project(cookies: Cookies, request: FixtureRequest) -> Result:
-    """Cookiecutter projects baked from all templates."""
-    return cookies.bake(
-        extra_context=request.param["context"],
-        template=str(request.param["template"]),
-    )
+def project(bakery: Bakery, request: FixtureRequest) -> Result:
+    """Cookiecutter projects baked from all templates.
+
+    Projects are shared between tests and must not be modified.
+    """
+    return bakery(request.param["template"], request.param["context"])
 
 
 @pytest.fixture(params=contexts_cpp)
-def project_cpp(cookies: Cookies, request: FixtureRequest) -> Result:
+def project_cpp(bakery: Bakery, request: FixtureRequest, tmp_path: Path) -> Result:
     """Cookiecutter projects baked from the cpp template."""
-    return cookies.bake(extra_context=request.param, template=str(repo_path / "cpp"))
+    return bake.clone(bakery(repo_path / "cpp", request.param), tmp_path)
 
 
 @pytest.fixture(params=contexts_python)
-def project_python(cookies: Cookies, request: FixtureRequest) -> Result:
+def project_python(bakery: Bakery, request: FixtureRequest, tmp_path: Path) -> Result:
     """Cookiecutter projects baked from the python template."""
-    return cookies.bake(extra_context=request.param, template=str(repo_path / "python"))
+    return bake.clone(bakery(repo_path / "python", request.param), tmp_path)
 
 
 @pytest.fixture(params=contexts_rust)
-def project_rust(cookies: Cookies, request: FixtureRequest) -> Result:
+def project_rust(bakery: Bakery, request: FixtureRequest, tmp_path: Path) -> Result:
     """Cookiecutter projects baked from the rust template."""
-    return cookies.bake(extra_context=request.param, template=str(repo_path / "rust"))
+    return bake.clone(bakery(repo_path / "rust", request.param), tmp_path)
 
 
 @pytest.fixture(params=contexts_vue)
-def project_vue(cookies: Cookies, request: FixtureRequest) -> Result:
+def project_vue(bakery: Bakery, request: FixtureRequest, tmp_path: Path) -> Result:
     """Cookiecutter projects baked from the vue template."""
-    return cookies.bake(extra_context=request.param, template=str(repo_path / "vue"))
+    return bake.clone(bakery(repo_path / "vue", request.param), tmp_path)
+
+
+@pytest.fixture(scope="session")
+def seeder(request: FixtureRequest, tmp_path_factory: pytest.TempPathFactory) -> Seeder:
+    """Warm toolchain installer for projects that run setup recipes."""
+    seed_dir = cache_dir(request, tmp_path_factory, "seed")
+
+    def seed_(project: Result) -> None:
+        seed.seed(project, seed_dir)
+
+    return seed_
+
+
+@pytest.fixture
+def trace(request: FixtureRequest, trace_dir: Path) -> Path:
+    """Chrome trace file for timing commands of the current test."""
+    name = re.sub(r"[^\w.-]+", "_", request.node.nodeid).strip("_")
+    return trace_dir / f"{name}.json"
+
+
+@pytest.fixture(scope="session")
+def trace_dir(
+    request: FixtureRequest, tmp_path_factory: pytest.TempPathFactory
+) -> Path:
+    """Directory for storing command timelines across test sessions."""
+    return cache_dir(request, tmp_path_factory, "trace")
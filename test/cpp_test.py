@@ -12,6 +12,8 @@ import pytest
 from test import util
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pytest_cookies.plugin import Cookies, Result
 
 
@@ -22,12 +24,24 @@ TEMPLATE = str(Path(__file__).parents[1] / "cpp")
     sys.platform == "win32",
     reason="Cookiecutter does not generate files with Windows line endings.",
 )
-def test_ci(project_cpp: Result) -> None:
+def test_ci(
+    build_cache: Callable[[Result], Path],
+    project_cpp: Result,
+    seeder: Callable[[Result], None],
+    trace: Path,
+) -> None:
     """Generated project passed ci Just recipe."""
+    seeder(project_cpp)
     util.process(
-        ["just", "ci"],
+        ["just", "--verbose", "ci"],
         cwd=project_cpp.project_path,
-        env={"CI": "true", "INIT": "true", **os.environ},
+        env={
+            "BUILD_CACHE": str(build_cache(project_cpp)),
+            "CI": "true",
+            "INIT": "true",
+            **os.environ,
+        },
+        trace=trace,
     )
 
 
@@ -36,7 +50,11 @@ def test_ci(project_cpp: Result) -> None:
     [
         (
             {"__project_package": "mock", "project_cli": True},
-            ["src/main.cpp"],
+            ["src/main.cpp", "test/cli.cpp"],
+        ),
+        (
+            {"__project_package": "mock", "project_cli": False},
+            ["bench/lib.cpp", "src/lib.cpp", "src/lib.hpp", "test/lib.cpp"],
         ),
     ],
 )
@@ -56,7 +74,7 @@ def test_existing_paths(
     [
         (
             {"__project_package": "mock", "project_cli": False},
-            ["src/main.cpp"],
+            ["src/main.cpp", "test/cli.cpp"],
         ),
     ],
 )
@@ -12,6 +12,8 @@ import pytest
 from test import util
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pytest_cookies.plugin import Cookies, Result
 
 
@@ -22,12 +24,16 @@ TEMPLATE = str(Path(__file__).parents[1] / "python")
     sys.platform == "win32",
     reason="Cookiecutter does not generate files with Windows line endings.",
 )
-def test_ci(project_python: Result) -> None:
+def test_ci(
+    project_python: Result, seeder: Callable[[Result], None], trace: Path
+) -> None:
     """Generated project passed ci Just recipe."""
+    seeder(project_python)
     util.process(
-        ["just", "ci"],
+        ["just", "--verbose", "ci"],
         cwd=project_python.project_path,
         env={"CI": "true", "INIT": "true", **os.environ},
+        trace=trace,
     )
 
 
@@ -36,7 +42,35 @@ def test_ci(project_python: Result) -> None:
     [
         (
             {"__project_package": "mock", "project_cli": True},
-            ["src/mock/__main__.py"],
+            [
+                "bench/stream_test.py",
+                "script/profiling.py",
+                "src/mock/__main__.py",
+                "src/mock/cli.py",
+                "src/mock/stream.py",
+                "test/profiling_test.py",
+                "test/stream_test.py",
+            ],
+        ),
+        (
+            {"__project_package": "mock", "project_async": True},
+            ["src/mock/pool.py", "test/pool_test.py"],
+        ),
+        (
+            {"__project_package": "mock", "project_compiled": True},
+            ["bench/core_test.py", "src/mock/core.py", "test/core_test.py"],
+        ),
+        (
+            {"__project_package": "mock", "project_instrument": True},
+            ["src/mock/instrument.py", "test/instrument_test.py"],
+        ),
+        (
+            {"__project_package": "mock", "project_parallel": True},
+            [
+                "bench/parallel_test.py",
+                "src/mock/parallel.py",
+                "test/parallel_test.py",
+            ],
         ),
     ],
 )
@@ -56,7 +90,35 @@ def test_existing_paths(
     [
         (
             {"__project_package": "mock", "project_cli": False},
-            ["src/mock/__main__.py"],
+            [
+                "bench/stream_test.py",
+                "script",
+                "src/mock/__main__.py",
+                "src/mock/cli.py",
+                "src/mock/stream.py",
+                "test/profiling_test.py",
+                "test/stream_test.py",
+            ],
+        ),
+        (
+            {"__project_package": "mock", "project_async": False},
+            ["src/mock/pool.py", "test/pool_test.py"],
+        ),
+        (
+            {"__project_package": "mock", "project_compiled": False},
+            ["bench/core_test.py", "src/mock/core.py", "test/core_test.py"],
+        ),
+        (
+            {"__project_package": "mock", "project_instrument": False},
+            ["src/mock/instrument.py", "test/instrument_test.py"],
+        ),
+        (
+            {"__project_package": "mock", "project_parallel": False},
+            [
+                "bench/parallel_test.py",
+                "src/mock/parallel.py",
+                "test/parallel_test.py",
+            ],
         ),
     ],
 )
@@ -78,6 +140,12 @@ def test_removed_paths(
         {"project_repository": "https://gitlab.com/scruffaluff/templates"},
         {"project_cli": True},
         {"project_cli": False},
+        {"project_async": True, "project_cli": True},
+        {"project_async": True, "project_cli": False},
+        {"project_compiled": True},
+        {"project_instrument": True, "project_cli": True},
+        {"project_instrument": True, "project_cli": False},
+        {"project_parallel": True},
     ],
 )
 def test_template(context: dict[str, Any], cookies: Cookies) -> None:
@@ -12,6 +12,8 @@ import pytest
 from test import util
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pytest_cookies.plugin import Cookies, Result
 
 
@@ -22,12 +24,24 @@ TEMPLATE = str(Path(__file__).parents[1] / "rust")
     sys.platform == "win32",
     reason="Cookiecutter does not generate files with Windows line endings.",
 )
-def test_ci(project_rust: Result) -> None:
+def test_ci(
+    build_cache: Callable[[Result], Path],
+    project_rust: Result,
+    seeder: Callable[[Result], None],
+    trace: Path,
+) -> None:
     """Generated project passed ci Just recipe."""
+    seeder(project_rust)
     util.process(
-        ["just", "ci"],
+        ["just", "--verbose", "ci"],
         cwd=project_rust.project_path,
-        env={"CI": "true", "INIT": "true", **os.environ},
+        env={
+            "BUILD_CACHE": str(build_cache(project_rust)),
+            "CI": "true",
+            "INIT": "true",
+            **os.environ,
+        },
+        trace=trace,
     )
 
 
@@ -38,6 +52,14 @@ def test_ci(project_rust: Result) -> None:
             {"__project_package": "mock", "project_cli": True},
             ["src/main.rs", "tests/cli.rs"],
         ),
+        (
+            {"__project_package": "mock", "project_cli": False},
+            ["benches/lib.rs", "src/lib.rs", "tests/lib.rs"],
+        ),
+        (
+            {"__project_package": "mock", "project_parallel": True},
+            ["src/process.rs", "tests/process.rs"],
+        ),
     ],
 )
 def test_existing_paths(
@@ -58,6 +80,10 @@ def test_existing_paths(
             {"__project_package": "mock", "project_cli": False},
             ["src/main.rs", "tests/cli.rs"],
         ),
+        (
+            {"__project_package": "mock", "project_parallel": False},
+            ["src/process.rs", "tests/process.rs"],
+        ),
     ],
 )
 def test_removed_paths(
@@ -78,6 +104,8 @@ def test_removed_paths(
         {"project_repository": "https://gitlab.com/scruffaluff/templates"},
         {"project_cli": True},
         {"project_cli": False},
+        {"project_cli": True, "project_parallel": True},
+        {"project_cli": False, "project_parallel": True},
     ],
 )
 def test_template(context: dict[str, Any], cookies: Cookies) -> None:
@@ -0,0 +1,239 @@
+"""Shared development toolchains for baked projects."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import shutil
+import subprocess
+import time
+from typing import TYPE_CHECKING
+
+from test import bake, util
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from pathlib import Path
+
+    from pytest_cookies.plugin import Result
+
+
+# Compiler version commands for projects that contain a manifest file.
+COMPILERS = {
+    "Cargo.toml": ["rustc", "--version", "--verbose"],
+    "conanfile.txt": [os.environ.get("CXX", "c++"), "--version"],
+}
+# Installed dependency folders and lockfiles that setup creates from manifests.
+DEPENDENCIES = [
+    ".venv",
+    "Cargo.lock",
+    "conan.lock",
+    "node_modules",
+    "pnpm-lock.yaml",
+    "uv.lock",
+]
+# Files whose contents determine the tools and dependencies installed by setup.
+MANIFESTS = [
+    "Cargo.toml",
+    "conanfile.txt",
+    "justfile",
+    "package.json",
+    "pnpm-workspace.yaml",
+    "pyproject.toml",
+]
+# Files whose contents determine compiler outputs that projects can share.
+TOOLCHAINS = [
+    "Cargo.lock",
+    "Cargo.toml",
+    "conan.lock",
+    "conanfile.txt",
+    "rust-toolchain.toml",
+]
+# Seconds after which unused compiler output folders are removed.
+STALE_AGE = 7 * 24 * 60 * 60
+# Vendor folders that are shared between projects with identical manifests.
+VENDORS = ["bin", "lib"]
+
+
+def build_cache(project: Result, cache_dir: Path) -> Path:
+    """Find compiler output folder shared by projects with identical toolchains.
+
+    Tests pass the folder to project recipes with the BUILD_CACHE environment
+    variable. Cargo and Ccache fingerprint all compiler inputs themselves, so
+    the key only separates projects whose dependencies or compilers differ.
+    Contexts of a template can have different keys in the same session, so
+    folders of a project are only removed once they have gone unused for a
+    week.
+
+    Args:
+        project: Baked project.
+        cache_dir: Directory for storing compiler outputs across sessions.
+
+    Returns:
+        Existing cache folder for the project.
+    """
+    name = project.project_path.name
+    hasher = hashlib.sha256(manifest_hash(project, TOOLCHAINS).encode())
+    hasher.update(compiler_version(project).encode())
+    path = cache_dir / f"{name}-{hasher.hexdigest()[:32]}"
+    path.mkdir(exist_ok=True, parents=True)
+    # Mark folder as used, since directory times only change with its entries.
+    path.touch()
+
+    regex = re.compile(rf"{re.escape(name)}-[0-9a-f]{{32}}")
+    for folder in cache_dir.iterdir():
+        if (
+            folder.is_dir()
+            and folder != path
+            and regex.fullmatch(folder.name)
+            and time.time() - folder.stat().st_mtime > STALE_AGE
+        ):
+            with bake.lock(folder):
+                shutil.rmtree(folder, ignore_errors=True)
+    return path
+
+
+def compiler_version(project: Result) -> str:
+    """Find version of the compiler that builds a project.
+
+    Compilers are looked up in the project vendor folders first, where setup
+    recipes install missing toolchains.
+
+    Args:
+        project: Baked and seeded project.
+
+    Returns:
+        Compiler version output or an empty string if no compiler was found.
+    """
+    vendor = project.project_path / ".vendor"
+    folders = [vendor / "bin", vendor / "lib/cargo/bin", os.environ.get("PATH", "")]
+    for manifest, command in COMPILERS.items():
+        if not (project.project_path / manifest).exists():
+            continue
+        program = shutil.which(command[0], path=os.pathsep.join(map(str, folders)))
+        if program is None:
+            continue
+        # Rustup selects the toolchain from the project working directory.
+        process = subprocess.run(
+            [program, *command[1:]],
+            capture_output=True,
+            check=False,
+            cwd=project.project_path,
+            text=True,
+        )
+        return process.stdout
+    return ""
+
+
+def manifest_hash(project: Result, names: Sequence[str] = MANIFESTS) -> str:
+    """Compute hash of project dependency manifests.
+
+    Args:
+        project: Baked project.
+        names: Manifest file names to include if they exist.
+
+    Returns:
+        Hexadecimal digest.
+    """
+    hasher = hashlib.sha256()
+    for name in names:
+        path = project.project_path / name
+        if path.exists():
+            hasher.update(name.encode())
+            hasher.update(path.read_bytes())
+    return hasher.hexdigest()[:32]
+
+
+def relocate(path: Path, source: Path, dest: Path) -> None:
+    """Rewrite absolute paths in an installed dependency folder.
+
+    Virtual environments and Node binary shims embed the absolute path of the
+    project that installed them. Only launcher scripts, path configuration
+    files, and install records contain such paths, so other files are left
+    untouched. Rewritten files are replaced instead of edited in place, since
+    they may be hard links into the seed project.
+
+    Args:
+        path: Dependency folder to fix.
+        source: Project folder that originally installed the dependencies.
+        dest: Project folder that now owns the dependencies.
+    """
+    old, new = str(source).encode(), str(dest).encode()
+    for file in path.rglob("*"):
+        if not file.is_file() or file.is_symlink():
+            continue
+        if not (
+            file.parent.name in {".bin", "bin", "Scripts"}
+            or file.name in {"direct_url.json", "pyvenv.cfg"}
+            or file.suffix == ".pth"
+        ):
+            continue
+        data = file.read_bytes()
+        if old in data:
+            mode = file.stat().st_mode
+            file.unlink()
+            file.write_bytes(data.replace(old, new))
+            file.chmod(mode)
+
+
+def seed(project: Result, cache_dir: Path) -> None:
+    """Give project a warm toolchain and installed dependencies.
+
+    The first project for each manifest hash is set up inside the cache
+    directory. Later projects symlink to its vendor folders, so their setup
+    recipes find every tool already installed. Tools are shared through the
+    seed project location, since installers embed absolute paths.
+
+    Installed dependencies and lockfiles of the seed project, such as virtual
+    environments and Node modules, are hard linked into the project if
+    possible and relocated. Setup recipes then only verify them instead of
+    resolving and installing from scratch. Downloads and compiled packages are
+    already shared through the user wide caches of Uv, Pnpm, Cargo, and Conan.
+
+    Args:
+        project: Baked project to seed.
+        cache_dir: Directory for storing toolchains across sessions.
+    """
+    root = cache_dir / f"{project.project_path.name}-{manifest_hash(project)}"
+    source = root / project.project_path.name
+
+    # Cold setups can take several minutes, so use a long stale lock timeout.
+    with bake.lock(root, timeout=3600):
+        if not (root / "ready").exists():
+            shutil.rmtree(root, ignore_errors=True)
+            bake.clone(project, root)
+            try:
+                util.process(
+                    ["just", "setup"],
+                    cwd=source,
+                    env={"CI": "true", "INIT": "true", **os.environ},
+                )
+            except BaseException:
+                shutil.rmtree(root, ignore_errors=True)
+                raise
+            (root / "ready").touch()
+
+    vendor = project.project_path / ".vendor"
+    vendor.mkdir(exist_ok=True)
+    for name in VENDORS:
+        target = source / ".vendor" / name
+        if target.exists():
+            (vendor / name).symlink_to(target, target_is_directory=True)
+
+    for name in DEPENDENCIES:
+        target = source / name
+        dest = project.project_path / name
+        if target.is_dir():
+            shutil.copytree(target, dest, copy_function=_link, symlinks=True)
+            relocate(dest, source, project.project_path)
+        elif target.is_file():
+            _link(target, dest)
+
+
+def _link(source: Path | str, dest: Path | str) -> None:
+    """Hard link file or copy it if linking is not possible."""
+    try:
+        os.link(source, dest)
+    except OSError:
+        shutil.copy2(source, dest)
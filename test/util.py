@@ -3,11 +3,17 @@
 from __future__ import annotations
 
 import contextlib
+import datetime
+import functools
+import json
 import os
 import re
 import subprocess
+import sys
+import threading
+import time
 from pathlib import Path
-from typing import TYPE_CHECKING, Any
+from typing import IO, TYPE_CHECKING, Any, TextIO
 
 if TYPE_CHECKING:
     from collections.abc import Iterator, Sequence
@@ -16,6 +22,9 @@ if TYPE_CHECKING:
 
     from pytest_cookies.plugin import Result
 
+# Line printed by Just in verbose mode when a recipe starts.
+RECIPE_REGEX = re.compile(r"^===> [Rr]unning recipe `([^`]+)`")
+
 
 @contextlib.contextmanager
 def chdir(dest_dir: Path) -> Iterator[None]:
@@ -35,20 +44,29 @@ def chdir(dest_dir: Path) -> Iterator[None]:
         os.chdir(source_directory)
 
 
-def file_matches(project: Result, regex_str: str) -> Iterator[Path]:
-    """Find all files in a directory whose name matches a regex.
+def file_index(project: Result) -> dict[Path, str]:
+    """Read all files of a baked project once.
+
+    Index is cached per project directory, so that multiple file checks share
+    a single directory walk and file read.
 
     Args:
-        project: Directory to search for files.
-        regex_str: Regex string for file names to satisfy.
+        project: Baked project to index.
 
-    Yields:
-        Matching file paths.
+    Returns:
+        Mapping of file paths to their text contents.
     """
-    regex = re.compile(regex_str)
-    for path in project.project_path.rglob("*"):
-        if path.is_file() and regex.match(path.name):
-            yield path
+    return _read_files(project.project_path)
+
+
+@functools.cache
+def _read_files(project_path: Path) -> dict[Path, str]:
+    """Read text contents of all files in a directory tree."""
+    return {
+        path: path.read_text()
+        for path in sorted(project_path.rglob("*"))
+        if path.is_file()
+    }
 
 
 def format_output(process: CompletedProcess) -> str:
@@ -58,23 +76,54 @@ def format_output(process: CompletedProcess) -> str:
     return f"{stdout}{stderr}\n"
 
 
-def process(command: Sequence[str], **kwargs: Any) -> CompletedProcess:
-    """Wrapper to `subprocess.Popen` with helpful error messages.
+def process(
+    command: Sequence[str], trace: Path | None = None, **kwargs: Any
+) -> CompletedProcess:
+    """Wrapper to `subprocess.Popen` with live output and helpful error messages.
 
     Args:
         command: Command to execute.
-        stream: Error message output stream.
+        trace: Chrome trace file for timings of verbose Just recipes.
         kwargs: Aruments forwarded to `subprocess.Popen`.
 
     Returns:
         Completed shell process information.
     """
-    process = subprocess.run(  # noqa: PLW1510
+    outputs: dict[str, list[str]] = {"stderr": [], "stdout": []}
+    recipes: list[tuple[str, float]] = []
+    start = time.perf_counter()
+
+    def read(name: str, pipe: IO[str], stream: TextIO) -> None:
+        for line in pipe:
+            outputs[name].append(line)
+            stream.write(line)
+            stream.flush()
+            match = RECIPE_REGEX.match(line)
+            if match is not None:
+                recipes.append((match.group(1), time.perf_counter() - start))
+
+    with subprocess.Popen(
+        command, stderr=subprocess.PIPE, stdout=subprocess.PIPE, text=True, **kwargs
+    ) as popen:
+        readers = [
+            threading.Thread(args=("stderr", popen.stderr, sys.stderr), target=read),
+            threading.Thread(args=("stdout", popen.stdout, sys.stdout), target=read),
+        ]
+        for reader in readers:
+            reader.start()
+        for reader in readers:
+            reader.join()
+        popen.wait()
+
+    process = subprocess.CompletedProcess(
         command,
-        capture_output=True,
-        text=True,
-        **kwargs,
+        popen.returncode,
+        "".join(outputs["stdout"]),
+        "".join(outputs["stderr"]),
     )
+    if trace is not None:
+        write_trace(trace, process, recipes, time.perf_counter() - start)
+
     # Change directory to process execution location for easier debugging.
     cwd = kwargs.get("cwd", ".")
     with chdir(cwd):
@@ -99,3 +148,62 @@ def show(match: Match) -> None:
 
     lines = before + text[start:stop] + after
     print(lines)
+
+
+def write_trace(
+    path: Path,
+    process: CompletedProcess,
+    recipes: Sequence[tuple[str, float]],
+    duration: float,
+) -> None:
+    """Save process and Just recipe timings in Chrome trace format.
+
+    Just prints a line when each recipe starts, so a recipe is assumed to run
+    until the next recipe starts or the process exits. The trace file only
+    holds the latest run, so recipe durations are also appended to a
+    history.jsonl file next to it for tracking them across runs.
+
+    Args:
+        path: Trace file destination.
+        process: Completed shell process information.
+        recipes: Recipe names and start times in seconds.
+        duration: Total process duration in seconds.
+    """
+    ends = [start for _, start in recipes[1:]] + [duration]
+    events = [
+        {
+            "args": {"command": list(process.args), "returncode": process.returncode},
+            "dur": round(duration * 1e6),
+            "name": " ".join(process.args),
+            "ph": "X",
+            "pid": 0,
+            "tid": 0,
+            "ts": 0,
+        },
+        *(
+            {
+                "dur": round((end - start) * 1e6),
+                "name": name,
+                "ph": "X",
+                "pid": 0,
+                "tid": 1,
+                "ts": round(start * 1e6),
+            }
+            for (name, start), end in zip(recipes, ends, strict=True)
+        ),
+    ]
+    path.parent.mkdir(exist_ok=True, parents=True)
+    path.write_text(json.dumps({"displayTimeUnit": "ms", "traceEvents": events}))
+
+    record = {
+        "duration": round(duration, 3),
+        "name": path.stem,
+        "recipes": {
+            name: round(end - start, 3)
+            for (name, start), end in zip(recipes, ends, strict=True)
+        },
+        "returncode": process.returncode,
+        "time": datetime.datetime.now(datetime.UTC).isoformat(timespec="seconds"),
+    }
+    with path.with_name("history.jsonl").open("a", encoding="utf-8") as file:
+        file.write(json.dumps(record) + "\n")
@@ -12,6 +12,8 @@ import pytest
 from test import util
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     from pytest_cookies.plugin import Cookies, Result
 
 
@@ -22,12 +24,14 @@ TEMPLATE = str(Path(__file__).parents[1] / "vue")
     sys.platform == "win32",
     reason="Cookiecutter does not generate files with Windows line endings.",
 )
-def test_ci(project_vue: Result) -> None:
+def test_ci(project_vue: Result, seeder: Callable[[Result], None], trace: Path) -> None:
     """Generated project passed ci Just recipe."""
+    seeder(project_vue)
     util.process(
-        ["just", "ci"],
+        ["just", "--verbose", "ci"],
         cwd=project_vue.project_path,
         env={"CI": "true", "INIT": "true", **os.environ},
+        trace=trace,
     )
 
 